@@ -20,196 +20,128 @@ LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
 OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
 WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
-from abc import ABCMeta, abstractmethod
+from array import array
+from bisect import bisect_left
 from collections import deque
 from copy import deepcopy
-from typing import Iterable, Any, Union, TypeVar, Generator
+from heapq import merge
+from itertools import groupby, islice
+from typing import Iterable, Any, List, Optional, TypeVar, Generator
 
+try:
+    from typing import Protocol
+except ImportError:  # pragma: no cover  (Python < 3.8)
+    Protocol = object
 
-class Comparable(metaclass=ABCMeta):
-    @abstractmethod
-    def __lt__(self, other: Any) -> bool: pass
 
-    @abstractmethod
-    def __gt__(self, other: Any) -> bool: pass
+class Comparable(Protocol):
+    """Structural type of the entries: ordered with < and matched with ==."""
 
-    @abstractmethod
-    def __eq__(self, other: Any) -> bool: pass
+    def __lt__(self, other: Any) -> bool: ...
 
+    def __eq__(self, other: Any) -> bool: ...
 
-Entry = TypeVar('Entry', bound=Comparable)
-
-
-class _EmptyAVLNode:
-    """Internal object, represents an empty tree node using Null Object Pattern."""
-
-    def __init__(self):
-        self.height = 0
-
-    def insert(self, entry: Entry):
-        """Inserting a entry in a EmptyNode means returning a concrete node back."""
-        return _AVLNode(entry)
-
-    def delete(self, entry: Entry):
-        """Cannot delete a entry from a EmptyNode"""
-        raise KeyError(entry)
-
-    @property
-    def balance_factor(self):
-        """The balance factor of a empty node is always 0."""
-        return 0
-
-    def pred(self, pred: Union['_AVLNode', '_EmptyAVLNode'], entry: Entry):
-        raise KeyError(f'Predecessor of {entry} not found.')
-
-    def succ(self, pred, entry):
-        raise KeyError(f'Successor of {entry} not found.')
-
-    def __bool__(self):
-        """Empty node is always Falsy. """
-        return False
-
-    def __len__(self):
-        """The lenght of a empty node is always 0."""
-        return 0
-
-    def __eq__(self, other):
-        """Checks if a EmptyNode is equal to other"""
-        return isinstance(other, self.__class__)
 
-
-EMPTY_NODE = _EmptyAVLNode()
+Entry = TypeVar('Entry', bound=Comparable)
 
 
 class _AVLNode:
     """Internal object, represents a tree node."""
 
-    def __init__(self, entry: Entry = None):
+    __slots__ = ('entry', 'left', 'right', 'height', 'size')
+
+    def __init__(self, entry: Entry):
         """Creates a new node."""
         self.entry: Entry = entry
-        self.left: '_AVLNode' = EMPTY_NODE
-        self.right: '_AVLNode' = EMPTY_NODE
+        self.left: Optional['_AVLNode'] = None
+        self.right: Optional['_AVLNode'] = None
         self.height: int = 1
-
-    def insert(self, entry: Entry):
-        """Inserts a entry to the subtree."""
-        if entry > self.entry:
-            self.right = self.right.insert(entry)
-        elif entry < self.entry:
-            self.left = self.left.insert(entry)
-
-        return self._balanced_tree()
-
-    def delete(self, entry: Entry) -> Union['_AVLNode', _EmptyAVLNode]:
-        """Deletes a entry from subtree and return it balanced."""
-        if entry > self.entry:
-            self.right = self.right.delete(entry)
-        elif entry < self.entry:
-            self.left = self.left.delete(entry)
-        else:
-            if self.is_leaf():
-                return EMPTY_NODE
-
-            if self.left:
-                new_entry = self.left.max()
-                self.entry = new_entry
-                self.left = self.left.delete(new_entry)
-            else:
-                return self.right
-
-        return self._balanced_tree()
-
-    def clear(self) -> _EmptyAVLNode:
-        """Clears the whole subtree"""
-        if self.is_leaf():
-            return EMPTY_NODE
-        self.left = self.left.clear()
-        self.right = self.right.clear()
-
-        return EMPTY_NODE
-
-    def is_leaf(self) -> bool:
-        """Checks if the node is a leaf node, i. e, if its siblings are empty."""
-        return not (bool(self.left) or bool(self.right))
+        self.size: int = 1
 
     def max(self) -> Entry:
         """Returns the max element in the subtree."""
-        max_entry = self.entry
-        right_node = self.right
-        while right_node:
-            max_entry = right_node.entry
-            right_node = right_node.right
+        node = self
+        right = node.right
+        while right is not None:
+            node = right
+            right = node.right
 
-        return max_entry
+        return node.entry
 
     def min(self) -> Entry:
         """Returns the min element in the subtree."""
-        min_entry = self.entry
-        left_node = self.left
-        while left_node:
-            min_entry = left_node.entry
-            left_node = left_node.left
+        node = self
+        left = node.left
+        while left is not None:
+            node = left
+            left = node.left
 
-        return min_entry
-
-    @property
-    def balance_factor(self) -> int:
-        """Returns the balance factor of the node."""
-        return self.left.height - self.right.height
+        return node.entry
 
-    def __bool__(self) -> bool:
-        """Returns True if the node is not None"""
-        return self.entry is not None
+    def _balanced_tree(self) -> '_AVLNode':
+        """Returns balanced tree after balance operation."""
+        balance_factor = self._update_height()
 
-    def __len__(self) -> int:
-        """Return the number of elements in this subtree."""
-        return 1 + len(self.left) + len(self.right)
+        if balance_factor == 2:
+            left = self.left
+            inner, outer = left.right, left.left
+            if (0 if inner is None else inner.height) > (0 if outer is None else outer.height):
+                return self._rotate_left_right()
+            return self._rotate_right()
+        elif balance_factor == -2:
+            right = self.right
+            inner, outer = right.left, right.right
+            if (0 if inner is None else inner.height) > (0 if outer is None else outer.height):
+                return self._rotate_right_left()
+            return self._rotate_left()
 
-    def __eq__(self, other) -> bool:
-        """Checks if two nodes are equal."""
-        return self.entry == other.entry and self.left == other.left and self.right == other.right
+        return self
 
-    def _balanced_tree(self) -> '_AVLNode':
-        """Returns balanced tree after balance operation."""
-        self._update_height()
-        return self._balance_tree_if_unbalanced()
+    def _update_height(self) -> int:
+        """Updated the height if tree has been rebalanced and returns the balance factor."""
+        left, right = self.left, self.right
+        left_height = 0 if left is None else left.height
+        right_height = 0 if right is None else right.height
+        self.height = 1 + (left_height if left_height > right_height else right_height)
 
-    def _update_height(self) -> None:
-        """Updated the height if tree has been rebalanced."""
-        self.height = 1 + max(self.left.height, self.right.height)
+        return left_height - right_height
 
-    def _balance_tree_if_unbalanced(self) -> '_AVLNode':
-        """Performs the appropriate rotation if the the subtree is unbalanced."""
-        if self.balance_factor == 2 and self.left.balance_factor == -1:
-            return self._rotate_left_right()
-        elif self.balance_factor == -2 and self.right.balance_factor == 1:
-            return self._rotate_right_left()
-        elif self.balance_factor == -2:
-            return self._rotate_left()
-        elif self.balance_factor == 2:
-            return self._rotate_right()
-        else:
-            return self
+    def _update_size(self) -> None:
+        """Updates the number of entries of the subtree from its children."""
+        left, right = self.left, self.right
+        self.size = 1 + (0 if left is None else left.size) + (0 if right is None else right.size)
 
     def _rotate_left(self) -> '_AVLNode':
         """Performs a left rotation."""
         right_tree = self.right
-        self.right = right_tree.left
+        inner = right_tree.left
+        self.right = inner
         right_tree.left = self
 
-        self._update_height()
-        right_tree._update_height()
+        left, outer = self.left, right_tree.right
+        right_tree.size = self.size
+        self.size = 1 + (0 if left is None else left.size) + (0 if inner is None else inner.size)
+        height = 1 + max(0 if left is None else left.height,
+                         0 if inner is None else inner.height)
+        self.height = height
+        right_tree.height = 1 + max(height, 0 if outer is None else outer.height)
 
         return right_tree
 
     def _rotate_right(self) -> '_AVLNode':
         """Performs a right rotation."""
         left_tree = self.left
-        self.left = left_tree.right
+        inner = left_tree.right
+        self.left = inner
         left_tree.right = self
 
-        self._update_height()
-        left_tree._update_height()
+        right, outer = self.right, left_tree.left
+        left_tree.size = self.size
+        self.size = 1 + (0 if inner is None else inner.size) + (0 if right is None else right.size)
+        height = 1 + max(0 if inner is None else inner.height,
+                         0 if right is None else right.height)
+        self.height = height
+        left_tree.height = 1 + max(height, 0 if outer is None else outer.height)
 
         return left_tree
 
@@ -223,31 +155,180 @@ class _AVLNode:
         self.right = self.right._rotate_right()
         return self._rotate_left()
 
-    def pred(self, pred: Union['_AVLNode', _EmptyAVLNode], entry) -> Entry:
-        if entry > self.entry:
-            return self.right.pred(self, entry)
-        elif entry < self.entry:
-            return self.left.pred(pred, entry)
-        else:
-            if self.left:
-                return self.left.max()
-            if pred:
-                return pred.entry
-
-            raise KeyError(f'Predecessor of {entry} not found.')
-
-    def succ(self, succ: Union['_AVLNode', _EmptyAVLNode], entry) -> Entry:
-        if entry > self.entry:
-            return self.right.succ(succ, entry)
-        elif entry < self.entry:
-            return self.left.succ(self, entry)
-        else:
-            if self.right:
-                return self.right.min()
-            if succ:
-                return succ.entry
 
-            raise KeyError(f'Successor of {entry} not found.')
+def _build_tree(entries: list, lo: int, hi: int) -> Optional[_AVLNode]:
+    """Builds a height-balanced subtree from the sorted slice entries[lo:hi] without rotations."""
+    if lo >= hi:
+        return None
+
+    mid = (lo + hi) // 2
+    node = _AVLNode(entries[mid])
+    node.left = _build_tree(entries, lo, mid)
+    node.right = _build_tree(entries, mid + 1, hi)
+    node._update_height()
+    node.size = hi - lo
+
+    return node
+
+
+def _clone_tree(root: Optional[_AVLNode], memo: dict = None) -> Optional[_AVLNode]:
+    """Returns a structural copy of the subtree at root. When memo is given the entries are deep
+    copied with it, otherwise the copy shares them with the original."""
+    if root is None:
+        return None
+
+    if memo is None:
+        def copy_entry(entry):
+            return entry
+    else:
+        def copy_entry(entry):
+            return deepcopy(entry, memo)
+
+    new_root = _AVLNode(copy_entry(root.entry))
+    stack = [(root, new_root)]
+    stack_append = stack.append
+    stack_pop = stack.pop
+
+    while stack:
+        node, clone = stack_pop()
+        if memo is not None:
+            memo[id(node)] = clone
+        clone.height = node.height
+        clone.size = node.size
+
+        left, right = node.left, node.right
+        if left is not None:
+            clone.left = _AVLNode(copy_entry(left.entry))
+            stack_append((left, clone.left))
+        if right is not None:
+            clone.right = _AVLNode(copy_entry(right.entry))
+            stack_append((right, clone.right))
+
+    return new_root
+
+
+def _unique_sorted(entries: list) -> list:
+    """Returns the sorted entries without duplicates."""
+    entries = sorted(entries)
+    return entries[:1] + [b for a, b in zip(entries, islice(entries, 1, None)) if a < b]
+
+
+def _height(node: Optional[_AVLNode]) -> int:
+    """Returns the height of a possibly empty subtree."""
+    return 0 if node is None else node.height
+
+
+def _as_float(entry: Any) -> float:
+    """Returns entry as the float a NumericAVLTree stores and compares it by."""
+    try:
+        return float(entry)
+    except (ValueError, TypeError) as e:
+        raise TypeError(f'NumericAVLTree called with incompatible data type: {e}')
+
+
+def _join(left: Optional[_AVLNode], node: _AVLNode, right: Optional[_AVLNode]) -> _AVLNode:
+    """Returns a balanced tree holding left, node and right, where left < node < right.
+
+    Reference: Blelloch, Ferizovic and Sun, "Just Join for Parallel Ordered Sets" (2016).
+    Runs in O(|height(left) - height(right)|).
+    """
+    left_height, right_height = _height(left), _height(right)
+    if left_height > right_height + 1:
+        return _join_right(left, node, right)
+    if right_height > left_height + 1:
+        return _join_left(left, node, right)
+
+    node.left, node.right = left, right
+    node._update_height()
+    node._update_size()
+    return node
+
+
+def _join_right(left: _AVLNode, node: _AVLNode, right: Optional[_AVLNode]) -> _AVLNode:
+    """Joins when left is the taller tree, hanging node and right down its right spine."""
+    inner = left.right
+    if _height(inner) <= _height(right) + 1:
+        node.left, node.right = inner, right
+        node._update_height()
+        node._update_size()
+        if node.height <= _height(left.left) + 1:
+            left.right = node
+            left._update_height()
+            left._update_size()
+            return left
+
+        left.right = node._rotate_right()
+        left._update_height()
+        left._update_size()
+        return left._rotate_left()
+
+    left.right = _join_right(inner, node, right)
+    left._update_height()
+    left._update_size()
+    if left.right.height <= _height(left.left) + 1:
+        return left
+    return left._rotate_left()
+
+
+def _join_left(left: Optional[_AVLNode], node: _AVLNode, right: _AVLNode) -> _AVLNode:
+    """Joins when right is the taller tree, hanging left and node down its left spine."""
+    inner = right.left
+    if _height(inner) <= _height(left) + 1:
+        node.left, node.right = left, inner
+        node._update_height()
+        node._update_size()
+        if node.height <= _height(right.right) + 1:
+            right.left = node
+            right._update_height()
+            right._update_size()
+            return right
+
+        right.left = node._rotate_left()
+        right._update_height()
+        right._update_size()
+        return right._rotate_right()
+
+    right.left = _join_left(left, node, inner)
+    right._update_height()
+    right._update_size()
+    if right.left.height <= _height(right.right) + 1:
+        return right
+    return right._rotate_right()
+
+
+def _split(root: Optional[_AVLNode], entry: Entry):
+    """Splits the tree into the balanced trees of the entries smaller and greater than entry.
+
+    Returns (smaller, node, greater), where node is the node holding entry or None.
+    """
+    if root is None:
+        return None, None, None
+
+    e = root.entry
+    if entry < e:
+        smaller, node, greater = _split(root.left, entry)
+        return smaller, node, _join(greater, root, root.right)
+    elif e < entry:
+        smaller, node, greater = _split(root.right, entry)
+        return _join(root.left, root, smaller), node, greater
+    else:
+        return root.left, root, root.right
+
+
+def _union(root: Optional[_AVLNode], other: Optional[_AVLNode]) -> Optional[_AVLNode]:
+    """Merges the tree other into root, dropping the entries of other that root already has.
+
+    Takes O(m log(n / m + 1)) for trees of sizes m <= n.
+    """
+    if root is None:
+        return other
+    if other is None:
+        return root
+
+    smaller, _, greater = _split(other, root.entry)
+    left = _union(root.left, smaller)
+    right = _union(root.right, greater)
+    return _join(left, root, right)
 
 
 class AVLTree:
@@ -278,15 +359,142 @@ class AVLTree:
     def __init__(self, args: Iterable[Any] = None):
         """Initialize an AVL Tree. """
         self.root: _AVLNode = None
+        self._min_entry: Optional[Entry] = None
+        self._max_entry: Optional[Entry] = None
         self._init_tree(args)
 
     def insert(self, entry: Entry) -> None:
         """T.insert(entry) -- insert elem"""
-        self.root = self.root.insert(entry)
+        path = []
+        path_append = path.append
+        node = self.root
+
+        while node is not None:
+            e = node.entry
+            if entry < e:
+                path_append((node, True))
+                node = node.left
+            elif e < entry:
+                path_append((node, False))
+                node = node.right
+            else:
+                return
+
+        for node, _ in path:
+            node.size += 1
+
+        if not path:
+            self._min_entry = self._max_entry = entry
+        elif entry < self._min_entry:
+            self._min_entry = entry
+        elif self._max_entry < entry:
+            self._max_entry = entry
+
+        self._retrace(path, _AVLNode(entry))
+
+    def insert_many(self, entries: Iterable[Entry]) -> None:
+        """T.insert_many(seq) -- insert every elem of seq
+
+        The entries are sorted and built into a balanced tree, which is then merged into T with
+        split and join operations instead of being rebalanced one insertion at a time. A batch
+        with incompatible entries raises TypeError and leaves T unchanged.
+        """
+        entries = _unique_sorted(entries)
+        if not entries:
+            return
+        if self.root is None:
+            self._build_from_sorted(entries)
+            return
+
+        # Comparing against the cached extremes first makes incompatible entries fail before
+        # the tree is touched.
+        min_entry = entries[0] if entries[0] < self._min_entry else self._min_entry
+        max_entry = self._max_entry if entries[-1] < self._max_entry else entries[-1]
+
+        self.root = _union(self.root, _build_tree(entries, 0, len(entries)))
+        self._min_entry, self._max_entry = min_entry, max_entry
+
+    def freeze(self) -> 'FrozenAVLTree':
+        """T.freeze() -> read-only snapshot of T, laid out for fast lookups."""
+        return FrozenAVLTree(self)
 
     def delete(self, entry: Entry) -> None:
         """T.remove(entry) remove item <entry> from tree."""
-        self.root = self.root.delete(entry)
+        path = []
+        path_append = path.append
+        node = self.root
+
+        while node is not None:
+            e = node.entry
+            if entry < e:
+                path_append((node, True))
+                node = node.left
+            elif e < entry:
+                path_append((node, False))
+                node = node.right
+            else:
+                break
+        else:
+            raise KeyError(entry)
+
+        left = node.left
+        if left is not None:
+            # Replace the entry with its in-order predecessor and unlink the predecessor instead.
+            target = node
+            path_append((node, True))
+            node = left
+            right = node.right
+            while right is not None:
+                path_append((node, False))
+                node = right
+                right = node.right
+            target.entry = node.entry
+            subtree = node.left
+        else:
+            subtree = node.right
+
+        for node, _ in path:
+            node.size -= 1
+
+        self._retrace(path, subtree)
+
+        root = self.root
+        if root is None:
+            self._min_entry = self._max_entry = None
+        elif not self._min_entry < entry:
+            self._min_entry = root.min()
+        elif not entry < self._max_entry:
+            self._max_entry = root.max()
+
+    def _retrace(self, path, subtree: Optional[_AVLNode]) -> None:
+        """Links subtree back under the last node of path and rebalances the ancestors.
+
+        The walk stops at the first ancestor whose subtree keeps its former height, since
+        nothing above it can change either.
+        """
+        while path:
+            parent, went_left = path.pop()
+            if went_left:
+                parent.left = subtree
+            else:
+                parent.right = subtree
+
+            old_height = parent.height
+            subtree = parent._balanced_tree()
+            if subtree.height == old_height:
+                if subtree is parent:
+                    return
+                # A rotation replaced the subtree root, so the next ancestor must point to it.
+                if path:
+                    parent, went_left = path[-1]
+                    if went_left:
+                        parent.left = subtree
+                    else:
+                        parent.right = subtree
+                    return
+                break
+
+        self.root = subtree
 
     def traverse(self, order='inorder') -> Generator[Entry, None, None]:
         """Traverse the tree based on a given strategy.
@@ -312,55 +520,100 @@ class AVLTree:
     @property
     def height(self) -> int:
         """Returns the height of the tree. When the tree is empty its height is zero."""
-        return self.root.height
+        root = self.root
+        return 0 if root is None else root.height
 
     def search(self, entry: Entry) -> Entry:
         """Returns k if T has a entry k, else raise KeyError"""
-        return self._search(entry).entry
+        node = self._search(entry)
+        if node is None:
+            raise KeyError(f'Entry {entry} not found.')
+        return node.entry
 
-    def _search(self, entry: Entry) -> _AVLNode:
-        """Returns node.k if T has a entry k, else raise KeyError"""
+    def _search(self, entry: Entry) -> Optional[_AVLNode]:
+        """Returns the node holding entry, or None if T has no such entry"""
         root = self.root
 
-        while root:
-            if entry > root.entry:
-                root = root.right
-            elif entry < root.entry:
+        while root is not None:
+            e = root.entry
+            if entry < e:
                 root = root.left
+            elif e < entry:
+                root = root.right
             else:
                 return root
 
-        raise KeyError(f'Entry {entry} not found.')
+        return None
 
     def pred(self, entry: Entry) -> Entry:
-        return self.root.pred(EMPTY_NODE, entry)
+        """T.pred(entry) -> get the entry that precedes <entry> in T, else raise KeyError"""
+        root = self.root
+        pred = None
+
+        while root is not None:
+            e = root.entry
+            if entry < e:
+                root = root.left
+            elif e < entry:
+                pred = e
+                root = root.right
+            else:
+                left = root.left
+                if left is not None:
+                    return left.max()
+                if pred is not None:
+                    return pred
+                break
+
+        raise KeyError(f'Predecessor of {entry} not found.')
 
     def succ(self, entry: Entry) -> Entry:
-        return self.root.succ(EMPTY_NODE, entry)
+        """T.succ(entry) -> get the entry that succeeds <entry> in T, else raise KeyError"""
+        root = self.root
+        succ = None
+
+        while root is not None:
+            e = root.entry
+            if entry < e:
+                succ = e
+                root = root.left
+            elif e < entry:
+                root = root.right
+            else:
+                right = root.right
+                if right is not None:
+                    return right.min()
+                if succ is not None:
+                    return succ
+                break
+
+        raise KeyError(f'Successor of {entry} not found.')
 
     def __len__(self) -> int:
         """T.__len__() <==> len(x). Retuns the number of elements in the tree."""
-        return len(self.root)
+        root = self.root
+        return 0 if root is None else root.size
 
     def __contains__(self, entry) -> bool:
         """k in T -> True if T has a entry k, else False"""
-        try:
-            self.search(entry)
-            return True
-        except KeyError:
-            return False
+        return self._search(entry) is not None
 
     def max(self) -> Entry:
         """T.max() -> get the maximum entry of T."""
-        return self.root.max()
+        if self.root is None:
+            raise ValueError('max() called on an empty tree')
+        return self._max_entry
 
     def min(self) -> Entry:
         """T.min() -> get the minimum entry of T."""
-        return self.root.min()
+        if self.root is None:
+            raise ValueError('min() called on an empty tree')
+        return self._min_entry
 
     def clear(self) -> None:
         """T.clear() -> Removes all entries of T leaving it empty."""
-        self.root = self.root.clear()
+        self.root = None
+        self._min_entry = self._max_entry = None
 
     def __repr__(self) -> str:
         """T.__repr__(...) <==> repr(x).
@@ -375,12 +628,13 @@ class AVLTree:
         """Checks if two trees are equal. """
         if isinstance(other, self.__class__):
             if self.height == other.height and len(self) == len(other):
-                return self.root == other.root
+                pairs = zip(self._inorder(self.root), other._inorder(other.root))
+                return all(a == b for a, b in pairs)
         return False
 
     def __bool__(self) -> bool:
         """Returns True if the tree is not empty"""
-        return bool(self.root)
+        return self.root is not None
 
     def __copy__(self) -> 'AVLTree':
         """Returns a shallow copy of the tree."""
@@ -390,65 +644,711 @@ class AVLTree:
         return result
 
     def __deepcopy__(self, memo) -> 'AVLTree':
+        """Returns a deep copy of the tree. Only the entries go through deepcopy, the nodes are
+        rebuilt directly."""
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            setattr(result, k, deepcopy(v, memo))
+            if k != 'root':
+                setattr(result, k, deepcopy(v, memo))
+        result.root = _clone_tree(self.root, memo)
         return result
 
     def _init_tree(self, args) -> None:
         """Initialize the tree according to the arguments passed. """
-        self.root = EMPTY_NODE
+        self.root = None
+        self._min_entry = self._max_entry = None
 
         if args is not None:
-            if isinstance(args, self.__class__):
-                args = args.traverse('bfs')
+            if isinstance(args, NumericAVLTree):
+                args = args.traverse()
+            elif isinstance(args, self.__class__):
+                # Copying the nodes keeps the shape of the source, so the copy compares equal.
+                self.root = _clone_tree(args.root)
+                self._min_entry, self._max_entry = args._min_entry, args._max_entry
+                return
 
             try:
-                for entry in args:
-                    self.insert(entry)
+                entries = list(args)
+                try:
+                    entries = _unique_sorted(entries)
+                except TypeError:
+                    # Entries that cannot be sorted as a whole are inserted one at a time.
+                    for entry in entries:
+                        self.insert(entry)
+                else:
+                    self._build_from_sorted(entries)
             except (ValueError, TypeError) as e:
                 raise TypeError('AVLTree constructor called with '
                                 f'incompatible data type: {e}')
 
+    def _build_from_sorted(self, entries: list) -> None:
+        """Replaces the tree with one built from strictly ascending entries."""
+        self.root = _build_tree(entries, 0, len(entries))
+        if entries:
+            self._min_entry, self._max_entry = entries[0], entries[-1]
+
     def _inorder(self, root) -> Generator[Entry, None, None]:
         """Performs an in-order traversal. """
-        if root:
-            yield from self._inorder(root.left)
+        stack = []
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack or root is not None:
+            while root is not None:
+                stack_append(root)
+                root = root.left
+            root = stack_pop()
             yield root.entry
-            yield from self._inorder(root.right)
+            root = root.right
 
     def _preorder(self, root) -> Generator[Entry, None, None]:
         """Performs an pre-order traversal."""
-        if root:
+        if root is None:
+            return
+
+        stack = [root]
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack:
+            root = stack_pop()
             yield root.entry
-            yield from self._preorder(root.left)
-            yield from self._preorder(root.right)
+            if root.right is not None:
+                stack_append(root.right)
+            if root.left is not None:
+                stack_append(root.left)
 
     def _postorder(self, root) -> Generator[Entry, None, None]:
         """Performs an post-order traversal."""
-        if root:
-            yield from self._postorder(root.left)
-            yield from self._postorder(root.right)
-            yield root.entry
+        if root is None:
+            return
+
+        stack = [(root, False)]
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack:
+            root, visited = stack_pop()
+            if visited:
+                yield root.entry
+                continue
+
+            stack_append((root, True))
+            if root.right is not None:
+                stack_append((root.right, False))
+            if root.left is not None:
+                stack_append((root.left, False))
 
     def _bfs(self) -> Generator[Entry, None, None]:
         """Performs an Breadth first traversal."""
         root = self.root
+        if root is None:
+            return
 
-        if root:
-            q = deque()
-            q.append(root)
+        q = deque([root])
+        append = q.append
+        popleft = q.popleft
 
-            while q:
-                root = q.popleft()
-                if not root:
-                    continue
+        while q:
+            root = popleft()
+            yield root.entry
 
-                yield root.entry
-                left = root.left
-                right = root.right
+            left = root.left
+            if left is not None:
+                append(left)
+            right = root.right
+            if right is not None:
+                append(right)
+
+
+class NumericAVLTree(AVLTree):
+    """
+    NumericAVLTree implements the AVLTree interface for numeric entries.
+
+    Instead of allocating an _AVLNode object per entry, nodes are stored as a structure of
+    arrays indexed by an integer node id: _entries[i] holds the entry of node i as a float,
+    _left[i] and _right[i] the ids of its children and _height[i] its height. Node 0 is a
+    sentinel standing for the empty subtree, so its height is always zero. A node takes a
+    handful of bytes instead of a whole Python object and neighbouring nodes live in
+    contiguous memory.
+
+    Entries are converted to float, so integers beyond 2 ** 53 lose precision.
+
+    NumericAVLTree() -> new empty tree.
+    NumericAVLTree(tree) -> new tree initialized from a tree
+    NumericAVLTree(seq) -> new tree initialized from seq [(entry1), (entry2), ... (entryN)]
+
+    """
+
+    def insert(self, entry: float) -> None:
+        """T.insert(entry) -- insert elem"""
+        entry = _as_float(entry)
+        entries, left, right = self._entries, self._left, self._right
+        path = []
+        path_append = path.append
+        node = self.root
+
+        while node:
+            e = entries[node]
+            if entry < e:
+                path_append((node, True))
+                node = left[node]
+            elif e < entry:
+                path_append((node, False))
+                node = right[node]
+            else:
+                return
+
+        node = self._new_node(entry)
+
+        if not path:
+            self._min_entry = self._max_entry = entry
+        elif entry < self._min_entry:
+            self._min_entry = entry
+        elif self._max_entry < entry:
+            self._max_entry = entry
+
+        self._retrace(path, node)
+
+    def insert_many(self, entries: Iterable[float]) -> None:
+        """T.insert_many(seq) -- insert every elem of seq
+
+        A batch that is small next to T is inserted one entry at a time. Otherwise the sorted
+        batch is merged in linear time with the current entries and the node arrays are rebuilt
+        compactly in a single pass.
+        """
+        try:
+            entries = sorted(set(map(float, entries)))
+        except (ValueError, TypeError) as e:
+            raise TypeError('NumericAVLTree.insert_many called with '
+                            f'incompatible data type: {e}')
+
+        if not entries:
+            return
+        # An insert costs a few times more than rebuilding one node, so rebuilding only pays off
+        # once the batch is a sizeable fraction of the tree.
+        if len(entries) * 8 < len(self):
+            for entry in entries:
+                self.insert(entry)
+            return
+
+        merged = merge(entries, self._inorder(self.root))
+        self._build_from_sorted([entry for entry, _ in groupby(merged)])
+
+    def delete(self, entry: float) -> None:
+        """T.remove(entry) remove item <entry> from tree."""
+        entry = _as_float(entry)
+        entries, left, right = self._entries, self._left, self._right
+        path = []
+        path_append = path.append
+        node = self.root
+
+        while node:
+            e = entries[node]
+            if entry < e:
+                path_append((node, True))
+                node = left[node]
+            elif e < entry:
+                path_append((node, False))
+                node = right[node]
+            else:
+                break
+        else:
+            raise KeyError(entry)
+
+        if left[node]:
+            # Replace the entry with its in-order predecessor and unlink the predecessor instead.
+            target = node
+            path_append((node, True))
+            node = left[node]
+            while right[node]:
+                path_append((node, False))
+                node = right[node]
+            entries[target] = entries[node]
+            subtree = left[node]
+        else:
+            subtree = right[node]
 
-                q.append(left)
-                q.append(right)
+        self._free_list.append(node)
+        self._retrace(path, subtree)
+
+        root = self.root
+        if not root:
+            # Nothing refers to the node slots any more, so release them instead of keeping
+            # them around for reuse.
+            self._init_tree(None)
+        elif not self._min_entry < entry:
+            self._min_entry = self._min(root)
+        elif not entry < self._max_entry:
+            self._max_entry = self._max(root)
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the tree. When the tree is empty its height is zero."""
+        return self._height[self.root]
+
+    def search(self, entry: float) -> float:
+        """Returns k if T has a entry k, else raise KeyError"""
+        node = self._search(entry)
+        if not node:
+            raise KeyError(f'Entry {entry} not found.')
+        return self._entries[node]
+
+    def _search(self, entry: float) -> int:
+        """Returns the id of the node holding entry, or 0 if T has no such entry"""
+        entry = _as_float(entry)
+        entries, left, right = self._entries, self._left, self._right
+        node = self.root
+
+        while node:
+            e = entries[node]
+            if entry < e:
+                node = left[node]
+            elif e < entry:
+                node = right[node]
+            else:
+                return node
+
+        return 0
+
+    def __contains__(self, entry) -> bool:
+        """k in T -> True if T has a entry k, else False"""
+        return self._search(entry) != 0
+
+    def pred(self, entry: float) -> float:
+        """T.pred(entry) -> get the entry that precedes <entry> in T, else raise KeyError"""
+        entry = _as_float(entry)
+        entries, left, right = self._entries, self._left, self._right
+        node = self.root
+        pred = None
+
+        while node:
+            e = entries[node]
+            if entry < e:
+                node = left[node]
+            elif e < entry:
+                pred = e
+                node = right[node]
+            else:
+                if left[node]:
+                    return self._max(left[node])
+                if pred is not None:
+                    return pred
+                break
+
+        raise KeyError(f'Predecessor of {entry} not found.')
+
+    def succ(self, entry: float) -> float:
+        """T.succ(entry) -> get the entry that succeeds <entry> in T, else raise KeyError"""
+        entry = _as_float(entry)
+        entries, left, right = self._entries, self._left, self._right
+        node = self.root
+        succ = None
+
+        while node:
+            e = entries[node]
+            if entry < e:
+                succ = e
+                node = left[node]
+            elif e < entry:
+                node = right[node]
+            else:
+                if right[node]:
+                    return self._min(right[node])
+                if succ is not None:
+                    return succ
+                break
+
+        raise KeyError(f'Successor of {entry} not found.')
+
+    def __len__(self) -> int:
+        """T.__len__() <==> len(x). Retuns the number of elements in the tree."""
+        return len(self._entries) - 1 - len(self._free_list)
+
+    def max(self) -> float:
+        """T.max() -> get the maximum entry of T."""
+        if not self.root:
+            raise ValueError('max() called on an empty tree')
+        return self._max_entry
+
+    def min(self) -> float:
+        """T.min() -> get the minimum entry of T."""
+        if not self.root:
+            raise ValueError('min() called on an empty tree')
+        return self._min_entry
+
+    def clear(self) -> None:
+        """T.clear() -> Removes all entries of T leaving it empty."""
+        self._init_tree(None)
+
+    def __bool__(self) -> bool:
+        """Returns True if the tree is not empty"""
+        return self.root != 0
+
+    def __deepcopy__(self, memo) -> 'NumericAVLTree':
+        """Returns a deep copy of the tree. The node arrays hold plain numbers, so copying them
+        is enough."""
+        cls = self.__class__
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        for k, v in self.__dict__.items():
+            setattr(result, k, deepcopy(v, memo))
+        return result
+
+    def _init_tree(self, args) -> None:
+        """Initialize the tree according to the arguments passed. """
+        self.root: int = 0
+        self._entries = array('d', [0.0])
+        self._left = array('i', [0])
+        self._right = array('i', [0])
+        self._height = array('i', [0])
+        self._free_list = []
+        self._min_entry = self._max_entry = None
+
+        if args is not None:
+            if isinstance(args, NumericAVLTree):
+                # Copying the node arrays keeps the shape of the source, so the copy compares
+                # equal.
+                self.root = args.root
+                self._entries = array('d', args._entries)
+                self._left = array('i', args._left)
+                self._right = array('i', args._right)
+                self._height = array('i', args._height)
+                self._free_list = list(args._free_list)
+                self._min_entry, self._max_entry = args._min_entry, args._max_entry
+                return
+            if isinstance(args, AVLTree):
+                args = args.traverse()
+
+            try:
+                entries = sorted(set(map(float, args)))
+            except (ValueError, TypeError) as e:
+                raise TypeError('NumericAVLTree constructor called with '
+                                f'incompatible data type: {e}')
+
+            self._build_from_sorted(entries)
+
+    def _build_from_sorted(self, entries: List[float]) -> None:
+        """Replaces the tree with one built from strictly ascending floats."""
+        # Node ids are 1-based positions in the sorted entries, so the tree is built in place.
+        n = len(entries)
+        self._entries = array('d', [0.0])
+        self._entries.extend(entries)
+        self._left = array('i', [0]) * (n + 1)
+        self._right = array('i', [0]) * (n + 1)
+        self._height = array('i', [0]) * (n + 1)
+        self._free_list = []
+        self.root = self._build_tree(1, n + 1)
+        if entries:
+            self._min_entry, self._max_entry = entries[0], entries[-1]
+        else:
+            self._min_entry = self._max_entry = None
+
+    def _build_tree(self, lo: int, hi: int) -> int:
+        """Links the nodes lo to hi - 1 into a height-balanced subtree and returns its root id."""
+        if lo >= hi:
+            return 0
+
+        mid = (lo + hi) // 2
+        self._left[mid] = self._build_tree(lo, mid)
+        self._right[mid] = self._build_tree(mid + 1, hi)
+        self._update_height(mid)
+
+        return mid
+
+    def _new_node(self, entry: float) -> int:
+        """Returns the id of a new leaf holding entry, reusing a deleted node slot if any."""
+        free_list = self._free_list
+        if free_list:
+            node = free_list.pop()
+            self._entries[node] = entry
+            self._left[node] = self._right[node] = 0
+            self._height[node] = 1
+            return node
+
+        self._entries.append(entry)
+        self._left.append(0)
+        self._right.append(0)
+        self._height.append(1)
+        return len(self._entries) - 1
+
+    def _retrace(self, path, subtree: int) -> None:
+        """Links subtree back under the last node of path and rebalances the ancestors.
+
+        The walk stops at the first ancestor whose subtree keeps its former height, since
+        nothing above it can change either.
+        """
+        left, right, height = self._left, self._right, self._height
+
+        while path:
+            parent, went_left = path.pop()
+            if went_left:
+                left[parent] = subtree
+            else:
+                right[parent] = subtree
+
+            old_height = height[parent]
+            subtree = self._balanced_tree(parent)
+            if height[subtree] == old_height:
+                if subtree == parent:
+                    return
+                # A rotation replaced the subtree root, so the next ancestor must point to it.
+                if path:
+                    parent, went_left = path[-1]
+                    if went_left:
+                        left[parent] = subtree
+                    else:
+                        right[parent] = subtree
+                    return
+                break
+
+        self.root = subtree
+
+    def _update_height(self, node: int) -> int:
+        """Updated the height if tree has been rebalanced and returns the balance factor."""
+        height = self._height
+        left_height = height[self._left[node]]
+        right_height = height[self._right[node]]
+        height[node] = 1 + (left_height if left_height > right_height else right_height)
+
+        return left_height - right_height
+
+    def _balanced_tree(self, node: int) -> int:
+        """Performs the appropriate rotation if the the subtree is unbalanced."""
+        balance_factor = self._update_height(node)
+
+        if balance_factor == 2:
+            left, right, height = self._left, self._right, self._height
+            child = left[node]
+            if height[right[child]] > height[left[child]]:
+                left[node] = self._rotate_left(child)
+            return self._rotate_right(node)
+        elif balance_factor == -2:
+            left, right, height = self._left, self._right, self._height
+            child = right[node]
+            if height[left[child]] > height[right[child]]:
+                right[node] = self._rotate_right(child)
+            return self._rotate_left(node)
+
+        return node
+
+    def _rotate_left(self, node: int) -> int:
+        """Performs a left rotation."""
+        left, right, height = self._left, self._right, self._height
+        right_tree = right[node]
+        inner = left[right_tree]
+        right[node] = inner
+        left[right_tree] = node
+
+        node_height = 1 + max(height[left[node]], height[inner])
+        height[node] = node_height
+        height[right_tree] = 1 + max(node_height, height[right[right_tree]])
+
+        return right_tree
+
+    def _rotate_right(self, node: int) -> int:
+        """Performs a right rotation."""
+        left, right, height = self._left, self._right, self._height
+        left_tree = left[node]
+        inner = right[left_tree]
+        left[node] = inner
+        right[left_tree] = node
+
+        node_height = 1 + max(height[inner], height[right[node]])
+        height[node] = node_height
+        height[left_tree] = 1 + max(node_height, height[left[left_tree]])
+
+        return left_tree
+
+    def _max(self, node: int) -> float:
+        """Returns the max element in the subtree rooted at node."""
+        right = self._right
+        while right[node]:
+            node = right[node]
+        return self._entries[node]
+
+    def _min(self, node: int) -> float:
+        """Returns the min element in the subtree rooted at node."""
+        left = self._left
+        while left[node]:
+            node = left[node]
+        return self._entries[node]
+
+    def _inorder(self, root: int) -> Generator[float, None, None]:
+        """Performs an in-order traversal. """
+        entries, left, right = self._entries, self._left, self._right
+        stack = []
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack or root:
+            while root:
+                stack_append(root)
+                root = left[root]
+            root = stack_pop()
+            yield entries[root]
+            root = right[root]
+
+    def _preorder(self, root: int) -> Generator[float, None, None]:
+        """Performs an pre-order traversal."""
+        if not root:
+            return
+
+        entries, left, right = self._entries, self._left, self._right
+        stack = [root]
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack:
+            root = stack_pop()
+            yield entries[root]
+            if right[root]:
+                stack_append(right[root])
+            if left[root]:
+                stack_append(left[root])
+
+    def _postorder(self, root: int) -> Generator[float, None, None]:
+        """Performs an post-order traversal."""
+        if not root:
+            return
+
+        entries, left, right = self._entries, self._left, self._right
+        stack = [(root, False)]
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack:
+            root, visited = stack_pop()
+            if visited:
+                yield entries[root]
+                continue
+
+            stack_append((root, True))
+            if right[root]:
+                stack_append((right[root], False))
+            if left[root]:
+                stack_append((left[root], False))
+
+    def _bfs(self) -> Generator[float, None, None]:
+        """Performs an Breadth first traversal."""
+        if not self.root:
+            return
+
+        entries, left, right = self._entries, self._left, self._right
+        q = deque([self.root])
+        append = q.append
+        popleft = q.popleft
+
+        while q:
+            root = popleft()
+            yield entries[root]
+
+            if left[root]:
+                append(left[root])
+            if right[root]:
+                append(right[root])
+
+
+class FrozenAVLTree:
+    """
+    FrozenAVLTree is a read-only snapshot of a tree, meant for read-heavy workloads.
+
+    The entries are stored in a single list in in-order position, which is the implicit
+    layout of a perfectly balanced binary search tree: the root of the range [lo, hi) is the
+    entry at (lo + hi) // 2 and its subtrees are the two halves around it. No child links are
+    stored, and lookups walk that implicit tree with bisect, so the whole descent runs in C
+    over contiguous memory.
+
+    FrozenAVLTree() -> new empty snapshot.
+    FrozenAVLTree(tree) -> new snapshot of a tree, same as tree.freeze()
+    FrozenAVLTree(seq) -> new snapshot of seq [(entry1), (entry2), ... (entryN)]
+
+    """
+
+    def __init__(self, args: Iterable[Any] = None):
+        """Initialize a snapshot. """
+        if args is None:
+            entries = []
+        elif hasattr(args, 'traverse'):
+            entries = list(args.traverse())
+        else:
+            try:
+                entries = _unique_sorted(args)
+            except (ValueError, TypeError) as e:
+                raise TypeError('FrozenAVLTree constructor called with '
+                                f'incompatible data type: {e}')
+
+        self._entries: List[Entry] = entries
+
+    @property
+    def height(self) -> int:
+        """Returns the height of the tree. When the tree is empty its height is zero."""
+        return len(self._entries).bit_length()
+
+    def search(self, entry: Entry) -> Entry:
+        """Returns k if T has a entry k, else raise KeyError"""
+        i = self._search(entry)
+        if i < 0:
+            raise KeyError(f'Entry {entry} not found.')
+        return self._entries[i]
+
+    def _search(self, entry: Entry) -> int:
+        """Returns the position of entry, or -1 if T has no such entry"""
+        entries = self._entries
+        i = bisect_left(entries, entry)
+        if i < len(entries) and not entry < entries[i]:
+            return i
+        return -1
+
+    def __contains__(self, entry) -> bool:
+        """k in T -> True if T has a entry k, else False"""
+        return self._search(entry) >= 0
+
+    def __len__(self) -> int:
+        """T.__len__() <==> len(x). Retuns the number of elements in the tree."""
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        """Returns True if the tree is not empty"""
+        return bool(self._entries)
+
+    def max(self) -> Entry:
+        """T.max() -> get the maximum entry of T."""
+        if not self._entries:
+            raise ValueError('max() called on an empty tree')
+        return self._entries[-1]
+
+    def min(self) -> Entry:
+        """T.min() -> get the minimum entry of T."""
+        if not self._entries:
+            raise ValueError('min() called on an empty tree')
+        return self._entries[0]
+
+    def traverse(self, order='inorder') -> Generator[Entry, None, None]:
+        """Traverse the entries of the tree in ascending order.
+
+        order : default 'inorder'
+            The snapshot keeps no explicit tree shape, so only the in-order traversal is
+            supported and any other order raises ValueError.
+
+        """
+        if order != 'inorder':
+            raise ValueError(f'FrozenAVLTree only supports the inorder traversal, got {order!r}')
+        return (entry for entry in self._entries)
+
+    def __repr__(self) -> str:
+        """T.__repr__(...) <==> repr(x).
+        Returns representation of the object that can be used to recreate the tree."""
+        return f'{self.__class__.__name__}({self._entries})'
+
+    def __str__(self) -> str:
+        """T.__str__(...) <==> str(x)."""
+        return repr(self)
+
+    def __eq__(self, other) -> bool:
+        """Checks if two snapshots hold the same entries. """
+        if isinstance(other, self.__class__):
+            return self._entries == other._entries
+        return False
@@ -0,0 +1,381 @@
+"""Copyright (c) 2018 Miguel Mendes, http://miguendes.me/
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+from bisect import bisect_left
+from typing import Iterable, Any, Generator, List
+
+from avl_tree import AVLTree, Entry
+
+
+class _BTreeNode:
+    """Internal object, represents a B-tree node holding a sorted run of entries."""
+
+    __slots__ = ('entries', 'children')
+
+    def __init__(self, entries: List[Entry] = None, children: List['_BTreeNode'] = None):
+        """Creates a new node. A node without children is a leaf."""
+        self.entries: List[Entry] = [] if entries is None else entries
+        self.children: List['_BTreeNode'] = [] if children is None else children
+
+    def max(self) -> Entry:
+        """Returns the max element in the subtree."""
+        node = self
+        while node.children:
+            node = node.children[-1]
+        return node.entries[-1]
+
+    def min(self) -> Entry:
+        """Returns the min element in the subtree."""
+        node = self
+        while node.children:
+            node = node.children[0]
+        return node.entries[0]
+
+
+class BTreeIndex:
+    """
+    BTreeIndex implements a B-tree with the same interface as AVLTree.
+
+    Reference: https://en.wikipedia.org/wiki/B-tree
+
+    Each node keeps up to order - 1 entries in a sorted list and up to order children, so
+    a lookup touches log_order(n) nodes instead of the log2(n) nodes of a binary tree, and
+    searches inside a node run in C through bisect over contiguous memory. This favours
+    large, read-heavy workloads, such as numeric indexes, where following one Python
+    reference per level dominates the cost of an AVLTree.
+
+    BTreeIndex expected comparable objects as entries.
+
+    BTreeIndex() -> new empty tree.
+    BTreeIndex(tree) -> new tree initialized from a tree
+    BTreeIndex(seq) -> new tree initialized from seq [(entry1), (entry2), ... (entryN)]
+    BTreeIndex(seq, order=64) -> new tree whose nodes have at most 64 children, order is even
+
+    """
+
+    def __init__(self, args: Iterable[Any] = None, order: int = 32):
+        """Initialize a B-tree. """
+        if order < 4 or order % 2:
+            raise ValueError(f'BTreeIndex order must be an even number of at least 4, '
+                             f'got {order}')
+
+        self.order = order
+        self._min_degree = order // 2
+        self.root = _BTreeNode()
+        self._size = 0
+        self._init_tree(args)
+
+    def insert(self, entry: Entry) -> None:
+        """T.insert(entry) -- insert elem"""
+        max_entries = 2 * self._min_degree - 1
+
+        if len(self.root.entries) == max_entries:
+            self.root = _BTreeNode(children=[self.root])
+            self._split_child(self.root, 0)
+
+        node = self.root
+        while True:
+            entries = node.entries
+            i = bisect_left(entries, entry)
+            if i < len(entries) and not entry < entries[i]:
+                return
+
+            if not node.children:
+                entries.insert(i, entry)
+                self._size += 1
+                return
+
+            if len(node.children[i].entries) == max_entries:
+                self._split_child(node, i)
+                median = entries[i]
+                if median < entry:
+                    i += 1
+                elif not entry < median:
+                    return
+
+            node = node.children[i]
+
+    def insert_many(self, entries: Iterable[Entry]) -> None:
+        """T.insert_many(seq) -- insert every elem of seq"""
+        for entry in entries:
+            self.insert(entry)
+
+    def delete(self, entry: Entry) -> None:
+        """T.remove(entry) remove item <entry> from tree."""
+        min_degree = self._min_degree
+        node = self.root
+
+        # Nodes are refilled on the way down, so the entry is always removed from a node that
+        # can spare it.
+        while True:
+            entries, children = node.entries, node.children
+            i = bisect_left(entries, entry)
+            found = i < len(entries) and not entry < entries[i]
+
+            if not children:
+                if not found:
+                    self._shrink_root()
+                    raise KeyError(entry)
+                del entries[i]
+                break
+
+            if found:
+                left, right = children[i], children[i + 1]
+                if len(left.entries) >= min_degree:
+                    entry = entries[i] = left.max()
+                    node = left
+                elif len(right.entries) >= min_degree:
+                    entry = entries[i] = right.min()
+                    node = right
+                else:
+                    self._merge_children(node, i)
+                    node = left
+                continue
+
+            if len(children[i].entries) < min_degree:
+                i = self._fill_child(node, i)
+            node = children[i]
+
+        self._size -= 1
+        self._shrink_root()
+
+    def traverse(self, order='inorder') -> Generator[Entry, None, None]:
+        """Traverse the entries of the tree in ascending order.
+
+        order : default 'inorder'
+            Only the in-order traversal is meaningful for a B-tree, any other order raises
+            ValueError.
+
+        """
+        if order != 'inorder':
+            raise ValueError(f'BTreeIndex only supports the inorder traversal, got {order!r}')
+        return self._inorder()
+
+    def _inorder(self) -> Generator[Entry, None, None]:
+        """Performs an in-order traversal. """
+        stack = [(self.root, 0)]
+        stack_append = stack.append
+        stack_pop = stack.pop
+
+        while stack:
+            node, i = stack_pop()
+            if not node.children:
+                yield from node.entries
+                continue
+
+            if i > 0:
+                yield node.entries[i - 1]
+            if i + 1 < len(node.children):
+                stack_append((node, i + 1))
+            stack_append((node.children[i], 0))
+
+    @property
+    def height(self) -> int:
+        """Returns the number of levels of the tree. When the tree is empty its height is zero."""
+        if not self._size:
+            return 0
+
+        height = 1
+        node = self.root
+        while node.children:
+            node = node.children[0]
+            height += 1
+        return height
+
+    def search(self, entry: Entry) -> Entry:
+        """Returns k if T has a entry k, else raise KeyError"""
+        node = self.root
+
+        while True:
+            entries = node.entries
+            i = bisect_left(entries, entry)
+            if i < len(entries) and not entry < entries[i]:
+                return entries[i]
+            if not node.children:
+                raise KeyError(f'Entry {entry} not found.')
+            node = node.children[i]
+
+    def pred(self, entry: Entry) -> Entry:
+        """T.pred(entry) -> get the entry that precedes <entry> in T, else raise KeyError"""
+        node = self.root
+        pred = None
+
+        while True:
+            entries, children = node.entries, node.children
+            i = bisect_left(entries, entry)
+            if i < len(entries) and not entry < entries[i]:
+                if children:
+                    return children[i].max()
+                if i > 0:
+                    return entries[i - 1]
+                if pred is not None:
+                    return pred
+                break
+            if not children:
+                break
+            if i > 0:
+                pred = entries[i - 1]
+            node = children[i]
+
+        raise KeyError(f'Predecessor of {entry} not found.')
+
+    def succ(self, entry: Entry) -> Entry:
+        """T.succ(entry) -> get the entry that succeeds <entry> in T, else raise KeyError"""
+        node = self.root
+        succ = None
+
+        while True:
+            entries, children = node.entries, node.children
+            i = bisect_left(entries, entry)
+            if i < len(entries) and not entry < entries[i]:
+                if children:
+                    return children[i + 1].min()
+                if i + 1 < len(entries):
+                    return entries[i + 1]
+                if succ is not None:
+                    return succ
+                break
+            if not children:
+                break
+            if i < len(entries):
+                succ = entries[i]
+            node = children[i]
+
+        raise KeyError(f'Successor of {entry} not found.')
+
+    def __len__(self) -> int:
+        """T.__len__() <==> len(x). Retuns the number of elements in the tree."""
+        return self._size
+
+    def __contains__(self, entry) -> bool:
+        """k in T -> True if T has a entry k, else False"""
+        try:
+            self.search(entry)
+            return True
+        except KeyError:
+            return False
+
+    def max(self) -> Entry:
+        """T.max() -> get the maximum entry of T."""
+        if not self._size:
+            raise ValueError('max() called on an empty tree')
+        return self.root.max()
+
+    def min(self) -> Entry:
+        """T.min() -> get the minimum entry of T."""
+        if not self._size:
+            raise ValueError('min() called on an empty tree')
+        return self.root.min()
+
+    def clear(self) -> None:
+        """T.clear() -> Removes all entries of T leaving it empty."""
+        self.root = _BTreeNode()
+        self._size = 0
+
+    def __repr__(self) -> str:
+        """T.__repr__(...) <==> repr(x).
+        Returns representation of the object that can be used to recreate the tree."""
+        return f'{self.__class__.__name__}({list(self.traverse())}, order={self.order})'
+
+    def __str__(self) -> str:
+        """T.__str__(...) <==> str(x)."""
+        return repr(self)
+
+    def __eq__(self, other) -> bool:
+        """Checks if two trees hold the same entries. """
+        if isinstance(other, self.__class__) and len(self) == len(other):
+            return all(a == b for a, b in zip(self.traverse(), other.traverse()))
+        return False
+
+    def __bool__(self) -> bool:
+        """Returns True if the tree is not empty"""
+        return self._size != 0
+
+    def _init_tree(self, args) -> None:
+        """Initialize the tree according to the arguments passed. """
+        if args is not None:
+            if isinstance(args, (AVLTree, BTreeIndex)):
+                args = args.traverse()
+
+            try:
+                for entry in args:
+                    self.insert(entry)
+            except (ValueError, TypeError) as e:
+                raise TypeError('BTreeIndex constructor called with '
+                                f'incompatible data type: {e}')
+
+    def _split_child(self, parent: _BTreeNode, i: int) -> None:
+        """Splits the full child i of parent around its median, which moves up into parent."""
+        child = parent.children[i]
+        min_degree = self._min_degree
+
+        right = _BTreeNode(child.entries[min_degree:], child.children[min_degree:])
+        parent.entries.insert(i, child.entries[min_degree - 1])
+        parent.children.insert(i + 1, right)
+
+        del child.entries[min_degree - 1:]
+        del child.children[min_degree:]
+
+    def _merge_children(self, parent: _BTreeNode, i: int) -> None:
+        """Merges child i + 1 of parent and the entry between them into child i."""
+        left = parent.children[i]
+        right = parent.children.pop(i + 1)
+
+        left.entries.append(parent.entries.pop(i))
+        left.entries.extend(right.entries)
+        left.children.extend(right.children)
+
+    def _fill_child(self, parent: _BTreeNode, i: int) -> int:
+        """Gives child i of parent an extra entry, borrowing from a sibling or merging with one.
+
+        Returns the index of the child that now covers the range of child i.
+        """
+        children = parent.children
+        child = children[i]
+
+        if i > 0 and len(children[i - 1].entries) >= self._min_degree:
+            left = children[i - 1]
+            child.entries.insert(0, parent.entries[i - 1])
+            parent.entries[i - 1] = left.entries.pop()
+            if left.children:
+                child.children.insert(0, left.children.pop())
+            return i
+
+        if i + 1 < len(children) and len(children[i + 1].entries) >= self._min_degree:
+            right = children[i + 1]
+            child.entries.append(parent.entries[i])
+            parent.entries[i] = right.entries.pop(0)
+            if right.children:
+                child.children.append(right.children.pop(0))
+            return i
+
+        if i + 1 < len(children):
+            self._merge_children(parent, i)
+            return i
+
+        self._merge_children(parent, i - 1)
+        return i - 1
+
+    def _shrink_root(self) -> None:
+        """Drops an empty root left behind by a merge of its last two children."""
+        root = self.root
+        if not root.entries and root.children:
+            self.root = root.children[0]
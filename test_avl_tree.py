@@ -23,7 +23,8 @@ WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 import functools
 import unittest
 
-from avl_tree import AVLTree
+from avl_tree import AVLTree, NumericAVLTree, FrozenAVLTree
+from btree import BTreeIndex
 
 
 @functools.total_ordering
@@ -44,6 +45,11 @@ class Entry:
         return f"{self.__class__.__name__}({self.a}, {self.b})"
 
 
+def balance_factor(node):
+    left, right = node.left, node.right
+    return (0 if left is None else left.height) - (0 if right is None else right.height)
+
+
 class AvlTreeTest(unittest.TestCase):
     def test_empty_tree(self):
         tree = AVLTree()
@@ -54,8 +60,9 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(9)
 
         self.assertEqual(tree.root.entry, 9)
-        self.assertEqual(tree.root.left.balance_factor, 0)
-        self.assertEqual(tree.root.right.balance_factor, 0)
+        self.assertEqual(tree.root.height, 1)
+        self.assertIsNone(tree.root.left)
+        self.assertIsNone(tree.root.right)
         self.assertTrue(tree)
 
     def test_insert_duplicated_entry(self):
@@ -130,48 +137,48 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree()
         tree.insert(9)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
 
         tree.insert(4)
-        self.assertEqual(root.balance_factor, 1)
-        self.assertEqual(root.left.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 1)
+        self.assertEqual(balance_factor(root.left), 0)
 
         tree.insert(14)
-        self.assertEqual(root.balance_factor, 0)
-        self.assertEqual(root.left.balance_factor, 0)
-        self.assertEqual(root.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
+        self.assertEqual(balance_factor(root.left), 0)
+        self.assertEqual(balance_factor(root.right), 0)
 
         tree.insert(17)
-        self.assertEqual(root.balance_factor, -1)
-        self.assertEqual(root.left.balance_factor, 0)
-        self.assertEqual(root.right.balance_factor, -1)
-        self.assertEqual(root.right.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), -1)
+        self.assertEqual(balance_factor(root.left), 0)
+        self.assertEqual(balance_factor(root.right), -1)
+        self.assertEqual(balance_factor(root.right.right), 0)
 
         tree.insert(7)
-        self.assertEqual(root.balance_factor, 0)
-        self.assertEqual(root.left.balance_factor, -1)
-        self.assertEqual(root.left.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
+        self.assertEqual(balance_factor(root.left), -1)
+        self.assertEqual(balance_factor(root.left.right), 0)
 
     def test_single_left_rotation(self):
         tree = AVLTree()
         tree.insert(1)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 1)
         self.assertEqual(root.entry, 1)
 
         tree.insert(2)
         root = tree.root
-        self.assertEqual(root.balance_factor, -1)
+        self.assertEqual(balance_factor(root), -1)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 1)
         self.assertEqual(root.right.entry, 2)
 
         tree.insert(3)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
-        self.assertEqual(root.left.balance_factor, 0)
-        self.assertEqual(root.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
+        self.assertEqual(balance_factor(root.left), 0)
+        self.assertEqual(balance_factor(root.right), 0)
         self.assertEqual(root.height, 2)
 
         self.assertEqual(root.entry, 2)
@@ -182,22 +189,22 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree()
         tree.insert(3)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 1)
         self.assertEqual(root.entry, 3)
 
         tree.insert(2)
         root = tree.root
-        self.assertEqual(root.balance_factor, 1)
+        self.assertEqual(balance_factor(root), 1)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 3)
         self.assertEqual(root.left.entry, 2)
 
         tree.insert(1)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
-        self.assertEqual(root.left.balance_factor, 0)
-        self.assertEqual(root.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
+        self.assertEqual(balance_factor(root.left), 0)
+        self.assertEqual(balance_factor(root.right), 0)
         self.assertEqual(root.height, 2)
 
         self.assertEqual(root.entry, 2)
@@ -208,22 +215,22 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree()
         tree.insert(3)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 1)
         self.assertEqual(root.entry, 3)
 
         tree.insert(1)
         root = tree.root
-        self.assertEqual(root.balance_factor, 1)
+        self.assertEqual(balance_factor(root), 1)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 3)
         self.assertEqual(root.left.entry, 1)
 
         tree.insert(2)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
-        self.assertEqual(root.left.balance_factor, 0)
-        self.assertEqual(root.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
+        self.assertEqual(balance_factor(root.left), 0)
+        self.assertEqual(balance_factor(root.right), 0)
         self.assertEqual(root.height, 2)
 
         self.assertEqual(root.entry, 2)
@@ -234,22 +241,22 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree()
         tree.insert(1)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 1)
         self.assertEqual(root.entry, 1)
 
         tree.insert(3)
         root = tree.root
-        self.assertEqual(root.balance_factor, -1)
+        self.assertEqual(balance_factor(root), -1)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 1)
         self.assertEqual(root.right.entry, 3)
 
         tree.insert(2)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
-        self.assertEqual(root.left.balance_factor, 0)
-        self.assertEqual(root.right.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
+        self.assertEqual(balance_factor(root.left), 0)
+        self.assertEqual(balance_factor(root.right), 0)
         self.assertEqual(root.height, 2)
 
         self.assertEqual(root.entry, 2)
@@ -260,14 +267,14 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree()
         tree.insert(8)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 1)
         self.assertEqual(root.entry, 8)
 
         tree.insert(5)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 1)
+        self.assertEqual(balance_factor(root), 1)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 8)
         self.assertEqual(root.left.entry, 5)
@@ -275,7 +282,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(11)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 8)
         self.assertEqual(root.right.entry, 11)
@@ -283,7 +290,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(4)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 1)
+        self.assertEqual(balance_factor(root), 1)
         self.assertEqual(root.height, 3)
         self.assertEqual(root.entry, 8)
         self.assertEqual(root.left.left.entry, 4)
@@ -291,7 +298,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(7)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 1)
+        self.assertEqual(balance_factor(root), 1)
         self.assertEqual(root.height, 3)
         self.assertEqual(root.entry, 8)
         self.assertEqual(root.left.right.entry, 7)
@@ -299,7 +306,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(2)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 3)
         self.assertEqual(root.entry, 5)
         self.assertEqual(root.left.entry, 4)
@@ -312,14 +319,14 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree()
         tree.insert(20)
         root = tree.root
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 1)
         self.assertEqual(root.entry, 20)
 
         tree.insert(10)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 1)
+        self.assertEqual(balance_factor(root), 1)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 20)
         self.assertEqual(root.left.entry, 10)
@@ -327,7 +334,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(25)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 2)
         self.assertEqual(root.entry, 20)
         self.assertEqual(root.right.entry, 25)
@@ -335,7 +342,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(23)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, -1)
+        self.assertEqual(balance_factor(root), -1)
         self.assertEqual(root.height, 3)
         self.assertEqual(root.entry, 20)
         self.assertEqual(root.right.left.entry, 23)
@@ -343,7 +350,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(29)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, -1)
+        self.assertEqual(balance_factor(root), -1)
         self.assertEqual(root.height, 3)
         self.assertEqual(root.entry, 20)
         self.assertEqual(root.right.right.entry, 29)
@@ -351,7 +358,7 @@ class AvlTreeTest(unittest.TestCase):
         tree.insert(30)
         root = tree.root
 
-        self.assertEqual(root.balance_factor, 0)
+        self.assertEqual(balance_factor(root), 0)
         self.assertEqual(root.height, 3)
         self.assertEqual(root.entry, 25)
         self.assertEqual(root.left.entry, 20)
@@ -395,6 +402,15 @@ class AvlTreeTest(unittest.TestCase):
             with self.subTest(f"test {order}"):
                 self.assertTupleEqual(tuple(tree.traverse(order)), expected_value)
 
+    def test_traversal_of_large_tree(self):
+        entries = get_random_entries()
+        tree = AVLTree(entries)
+
+        self.assertListEqual(list(tree.traverse()), sorted(entries))
+        for order in ('preorder', 'postorder', 'bfs'):
+            with self.subTest(f"test {order}"):
+                self.assertListEqual(sorted(tree.traverse(order)), sorted(entries))
+
     def test_length(self):
         tree = AVLTree()
 
@@ -470,6 +486,40 @@ class AvlTreeTest(unittest.TestCase):
         with self.subTest(f"tree must have {math.ceil(math.log2(len(entries)))} height."):
             self.assertEqual(tree.height, math.ceil(math.log2(len(entries))))
 
+    def test_initialize_tree_from_sorted_sequence(self):
+        import math
+        for size in (1, 2, 3, 100, 1023, 1024):
+            entries = list(range(size))
+            tree = AVLTree(entries)
+
+            with self.subTest(f"test building tree with {size} sorted entries."):
+                self.assert_avl_invariants(tree.root)
+                self.assertEqual(len(tree), size)
+                self.assertEqual(tree.height, math.floor(math.log2(size)) + 1)
+                self.assertListEqual(list(tree.traverse()), entries)
+
+    def test_initialize_tree_from_unsorted_sequence_with_duplicates(self):
+        tree = AVLTree([3, 1, 2, 3, 1])
+
+        self.assertListEqual(list(tree.traverse()), [1, 2, 3])
+        self.assert_avl_invariants(tree.root)
+
+    def test_initialize_tree_from_unsorted_sequence(self):
+        entries = get_random_entries()
+        tree = AVLTree(entries)
+
+        self.assertEqual(tree.height, len(entries).bit_length())
+        self.assertListEqual(list(tree.traverse()), sorted(entries))
+        self.assertEqual(tree.min(), min(entries))
+        self.assertEqual(tree.max(), max(entries))
+        self.assert_avl_invariants(tree.root)
+
+    def test_initialize_tree_from_unsortable_sequence(self):
+        with self.assertRaises(TypeError) as context:
+            AVLTree([1, 'a', 2])
+        self.assertIn("AVLTree constructor called with incompatible data type: ",
+                      str(context.exception))
+
     def test_constructor_not_properly_called(self):
         with self.assertRaises(TypeError) as context:
             AVLTree(4)
@@ -486,6 +536,85 @@ class AvlTreeTest(unittest.TestCase):
         tree = AVLTree(entries)
         self.assertEqual(tree.min(), min(entries))
 
+    def test_min_max_follow_inserts_and_deletes(self):
+        entries = get_random_entries()
+        tree = AVLTree()
+
+        for entry in entries:
+            tree.insert(entry)
+        self.assertEqual(tree.min(), min(entries))
+        self.assertEqual(tree.max(), max(entries))
+
+        remaining = sorted(entries)
+        while len(remaining) > 1:
+            tree.delete(remaining.pop(0))
+            tree.delete(remaining.pop())
+            if remaining:
+                self.assertEqual(tree.min(), remaining[0])
+                self.assertEqual(tree.max(), remaining[-1])
+
+    def test_min_max_after_deleting_equivalent_entry(self):
+        class Key:
+            def __init__(self, key):
+                self.key = key
+
+            def __lt__(self, other):
+                return self.key < other.key
+
+        tree = AVLTree([Key(1), Key(2), Key(3)])
+        tree.delete(Key(1))
+        tree.delete(Key(3))
+
+        self.assertEqual(tree.min().key, 2)
+        self.assertEqual(tree.max().key, 2)
+
+    def test_min_max_of_empty_tree(self):
+        tree = AVLTree([1])
+        tree.delete(1)
+
+        with self.assertRaises(ValueError):
+            tree.min()
+        with self.assertRaises(ValueError):
+            tree.max()
+
+    def test_insert_many(self):
+        import random
+        random.seed(7477)
+
+        for size, batch in ((0, 100), (100, 0), (1000, 10), (10, 1000), (500, 500)):
+            entries = random.sample(range(5000), size)
+            new_entries = [random.randrange(5000) for _ in range(batch)]
+            tree = AVLTree()
+            for entry in entries:
+                tree.insert(entry)
+
+            tree.insert_many(new_entries)
+
+            expected = sorted(set(entries) | set(new_entries))
+            with self.subTest(f"test merging {batch} entries into {size} entries"):
+                self.assert_avl_invariants(tree.root)
+                self.assertListEqual(list(tree.traverse()), expected)
+                self.assertEqual(len(tree), len(expected))
+                if expected:
+                    self.assertEqual(tree.min(), expected[0])
+                    self.assertEqual(tree.max(), expected[-1])
+
+    def test_insert_many_incompatible_entries(self):
+        tree = AVLTree([1, 2, 3])
+
+        with self.assertRaises(TypeError):
+            tree.insert_many(['a', 'b'])
+        self.assertListEqual(list(tree.traverse()), [1, 2, 3])
+
+        with self.assertRaises(TypeError):
+            tree.insert_many([4, 'a'])
+        self.assertListEqual(list(tree.traverse()), [1, 2, 3])
+
+        with self.assertRaises(TypeError):
+            tree.insert_many(iter(['a']))
+        self.assertListEqual(list(tree.traverse()), [1, 2, 3])
+        self.assert_avl_invariants(tree.root)
+
     def test_delete_single_element(self):
         tree = AVLTree([1])
 
@@ -520,7 +649,9 @@ class AvlTreeTest(unittest.TestCase):
 
     def test_delete_entry_but_tree_remains_balanced(self):
         entries = [10, 5, 11, 3, 7, 15]
-        tree = AVLTree(entries)
+        tree = AVLTree()
+        for entry in entries:
+            tree.insert(entry)
         entry_to_be_deleted = 10
 
         tree.delete(entry_to_be_deleted)
@@ -531,7 +662,9 @@ class AvlTreeTest(unittest.TestCase):
 
     def test_delete_entry_make_tree_unbalanced(self):
         entries = [5, 3, 8, 2, 4, 7, 11, 1, 6, 10, 12, 9]
-        tree = AVLTree(entries)
+        tree = AVLTree()
+        for entry in entries:
+            tree.insert(entry)
         entry_to_be_deleted = 4
 
         tree.delete(entry_to_be_deleted)
@@ -542,7 +675,9 @@ class AvlTreeTest(unittest.TestCase):
 
     def test_delete_entries_in_a_row(self):
         entries = [2, 1, 4, 3, 5]
-        tree = AVLTree(entries)
+        tree = AVLTree()
+        for entry in entries:
+            tree.insert(entry)
 
         tree.delete(1)
         self.assertNotIn(1, tree)
@@ -565,14 +700,48 @@ class AvlTreeTest(unittest.TestCase):
         self.assertTupleEqual(tuple(tree.traverse('bfs')), ())
         self.assertFalse(tree)
 
+    def test_random_inserts_and_deletes_keep_tree_balanced(self):
+        import random
+        random.seed(7477)
+        entries = list(range(1000))
+        random.shuffle(entries)
+        tree = AVLTree()
+
+        for entry in entries:
+            tree.insert(entry)
+        self.assert_avl_invariants(tree.root)
+
+        random.shuffle(entries)
+        for i, entry in enumerate(entries):
+            tree.delete(entry)
+            self.assertNotIn(entry, tree)
+            if i % 50 == 0:
+                self.assert_avl_invariants(tree.root)
+        self.assertFalse(tree)
+
+    def assert_avl_invariants(self, node, lower=None, upper=None):
+        if not node:
+            return 0
+        if lower is not None:
+            self.assertGreater(node.entry, lower)
+        if upper is not None:
+            self.assertLess(node.entry, upper)
+        left_height = self.assert_avl_invariants(node.left, lower, node.entry)
+        right_height = self.assert_avl_invariants(node.right, node.entry, upper)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(node.height, 1 + max(left_height, right_height))
+        self.assertEqual(node.size, 1 + (node.left.size if node.left else 0)
+                         + (node.right.size if node.right else 0))
+        return node.height
+
     def test_str_repr(self):
         tree = AVLTree([1, 2, 3, 4, 5])
-        self.assertEqual(repr(tree), 'AVLTree([2, 1, 4, 3, 5])')
-        self.assertEqual(str(tree), 'AVLTree([2, 1, 4, 3, 5])')
+        self.assertEqual(repr(tree), 'AVLTree([3, 2, 5, 1, 4])')
+        self.assertEqual(str(tree), 'AVLTree([3, 2, 5, 1, 4])')
 
     def test_equals(self):
         tree1 = AVLTree([1, 2, 3, 4, 5])
-        tree2 = AVLTree([2, 1, 4, 3, 5])
+        tree2 = AVLTree([3, 2, 5, 1, 4])
         tree3 = AVLTree([1, 2, 3, 4, 5, 6])
 
         with self.subTest(f"test equal trees"):
@@ -587,6 +756,15 @@ class AvlTreeTest(unittest.TestCase):
             self.assertNotEqual(tree1, int(9))
         with self.subTest(f"test tree is different from empty tree"):
             self.assertNotEqual(tree1, AVLTree())
+        with self.subTest("test trees with the same entries in different shapes"):
+            tree4 = AVLTree()
+            for entry in (2, 1, 4, 3, 5):
+                tree4.insert(entry)
+            self.assertEqual(tree1.height, tree4.height)
+            self.assertNotEqual(tuple(tree1.traverse('bfs')), tuple(tree4.traverse('bfs')))
+            self.assertEqual(tree1, tree4)
+        with self.subTest("test trees with different entries"):
+            self.assertNotEqual(tree1, AVLTree([1, 2, 3, 4, 6]))
 
     def test_clear(self):
         tree = AVLTree([1, 2, 3, 4, 5])
@@ -598,7 +776,28 @@ class AvlTreeTest(unittest.TestCase):
         original = AVLTree([1, 2, 3, 4, 5])
         copy = AVLTree(original)
 
-        self.assertEqual(copy, AVLTree([2, 1, 4, 3, 5]))
+        self.assertEqual(copy, AVLTree([3, 2, 5, 1, 4]))
+
+    def test_build_tree_from_other_keeps_shape(self):
+        from random import sample, seed
+        seed(2024)
+        for _ in range(50):
+            original = AVLTree()
+            for entry in sample(range(200), 120):
+                original.insert(entry)
+            for entry in sample(range(200), 80):
+                if entry in original:
+                    original.delete(entry)
+            copy = AVLTree(original)
+
+            self.assertEqual(copy, original)
+            self.assertEqual(list(copy._bfs()), list(original._bfs()))
+            self.assertEqual(copy.min(), original.min())
+            self.assertEqual(copy.max(), original.max())
+            self.assert_avl_invariants(copy.root)
+
+        copy.insert(1000)
+        self.assertNotIn(1000, original)
 
     def test_search(self):
         tree = AVLTree([1, 2, 3, 4, 5])
@@ -620,6 +819,20 @@ class AvlTreeTest(unittest.TestCase):
             tree.search(entry)
         self.assertIn(f"Entry {entry} not found.", str(context.exception))
 
+    def test_entries_are_only_compared_with_less_than(self):
+        class LessThanOnly(Entry):
+            def __gt__(self, other):
+                raise AssertionError('AVLTree must only compare entries with <')
+
+        entries = [LessThanOnly(i, 'a') for i in get_random_entries()]
+        tree = AVLTree(entries)
+        for entry in entries[::2]:
+            tree.delete(entry)
+
+        for entry in entries[1::2]:
+            self.assertEqual(tree.search(entry), entry)
+        self.assertEqual(len(tree), len(entries[1::2]))
+
     def test_copy(self):
         import copy
         single_entry = Entry(1, ['a'])
@@ -644,6 +857,21 @@ class AvlTreeTest(unittest.TestCase):
         single_entry.b = 'a'
         self.assertNotEqual(tree1, tree2)
 
+    def test_deepcopy_keeps_structure(self):
+        import copy
+        tree1 = AVLTree(get_random_entries())
+        tree2 = copy.deepcopy(tree1)
+
+        self.assertIsNot(tree1.root, tree2.root)
+        self.assertTupleEqual(tuple(tree1.traverse('bfs')), tuple(tree2.traverse('bfs')))
+        self.assert_avl_invariants(tree2.root)
+        self.assertEqual(tree1.min(), tree2.min())
+        self.assertEqual(tree1.max(), tree2.max())
+        self.assertEqual(copy.deepcopy(AVLTree()), AVLTree())
+
+        tree2.delete(tree2.max())
+        self.assertEqual(len(tree1), len(tree2) + 1)
+
     def test_pred(self):
         import random
         random.seed(7477)
@@ -686,6 +914,333 @@ class AvlTreeTest(unittest.TestCase):
         self.assertIn("Successor of 1000000 not found.", str(context.exception))
 
 
+class NumericAvlTreeTest(unittest.TestCase):
+    def test_empty_tree(self):
+        tree = NumericAVLTree()
+
+        self.assertFalse(tree)
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.height, 0)
+        self.assertNotIn(1, tree)
+        self.assertTupleEqual(tuple(tree.traverse()), ())
+
+    def test_initialize_tree_from_sequence(self):
+        entries = get_random_entries()
+        tree = NumericAVLTree(entries)
+
+        self.assertEqual(len(tree), len(entries))
+        self.assertListEqual(list(tree.traverse()), sorted(entries))
+        self.assert_avl_invariants(tree, tree.root)
+
+    def test_initialize_tree_from_other(self):
+        tree = NumericAVLTree(AVLTree([5, 3, 1, 4, 2]))
+
+        self.assertEqual(repr(tree), 'NumericAVLTree([3.0, 2.0, 5.0, 1.0, 4.0])')
+        self.assertEqual(tree, NumericAVLTree([1, 2, 3, 4, 5]))
+        self.assertNotEqual(tree, NumericAVLTree([1, 2, 3, 4]))
+
+    def test_initialize_tree_from_numeric_tree_keeps_shape(self):
+        original = NumericAVLTree()
+        for entry in (20, 10, 25, 23, 29, 30, 5):
+            original.insert(entry)
+        original.delete(25)
+        copy = NumericAVLTree(original)
+
+        self.assertEqual(copy, original)
+        self.assertEqual(list(copy.traverse('bfs')), list(original.traverse('bfs')))
+        copy.insert(40)
+        self.assertNotIn(40, original)
+
+    def test_deleted_slots_are_reused_and_released(self):
+        tree = NumericAVLTree(range(100))
+        for entry in range(0, 100, 2):
+            tree.delete(entry)
+        for entry in range(100, 150):
+            tree.insert(entry)
+
+        self.assertEqual(len(tree._entries), 101)
+        self.assertListEqual(tree._free_list, [])
+        self.assert_avl_invariants(tree, tree.root)
+
+        for entry in list(tree.traverse()):
+            tree.delete(entry)
+        self.assertEqual(len(tree._entries), 1)
+        self.assertListEqual(tree._free_list, [])
+        self.assertEqual(len(tree), 0)
+
+    def test_entries_are_compared_as_floats(self):
+        from fractions import Fraction
+        tree = NumericAVLTree([0.1, 2 ** 53])
+        tree.insert(Fraction(1, 10))
+        tree.insert(2 ** 53 + 1)
+
+        self.assertEqual(len(tree), 2)
+        self.assertListEqual(list(tree.traverse()), [0.1, 2.0 ** 53])
+        self.assertIn(Fraction(1, 10), tree)
+        self.assertEqual(tree.search(2 ** 53 + 1), 2.0 ** 53)
+        self.assertEqual(tree.succ(Fraction(1, 10)), 2.0 ** 53)
+        self.assertEqual(tree.pred(2 ** 53 + 1), 0.1)
+        with self.assertRaises(TypeError) as context:
+            tree.insert('a')
+        self.assertIn("NumericAVLTree called with incompatible data type: ",
+                      str(context.exception))
+
+        tree.delete(Fraction(1, 10))
+        self.assertListEqual(list(tree.traverse()), [2.0 ** 53])
+
+    def test_rejected_insert_keeps_free_slot(self):
+        class Top:
+            def __lt__(self, other):
+                return False
+
+            def __gt__(self, other):
+                return True
+
+        tree = NumericAVLTree([1, 2])
+        tree.delete(1)
+        with self.assertRaises(TypeError):
+            tree.insert(Top())
+
+        self.assertEqual(len(tree), 1)
+        self.assertListEqual(list(tree.traverse()), [2])
+        tree.insert(3)
+        self.assertListEqual(list(tree.traverse()), [2, 3])
+        self.assertEqual(len(tree._entries), 3)
+
+    def test_constructor_not_properly_called(self):
+        with self.assertRaises(TypeError) as context:
+            NumericAVLTree(['a'])
+        self.assertIn("NumericAVLTree constructor called with incompatible data type: ",
+                      str(context.exception))
+
+    def test_traversal(self):
+        tree = NumericAVLTree()
+        for entry in (20, 10, 25, 23, 29, 30):
+            tree.insert(entry)
+
+        d = {
+            'preorder': (25, 20, 10, 23, 29, 30),
+            'inorder': (10, 20, 23, 25, 29, 30),
+            'postorder': (10, 23, 20, 30, 29, 25),
+            'bfs': (25, 20, 29, 10, 23, 30),
+        }
+
+        for order, expected_value in d.items():
+            with self.subTest(f"test {order}"):
+                self.assertTupleEqual(tuple(tree.traverse(order)), expected_value)
+
+    def test_random_inserts_and_deletes(self):
+        import random
+        random.seed(7477)
+        tree = NumericAVLTree()
+        expected = set()
+
+        for i in range(5000):
+            entry = random.randrange(300)
+            if random.random() < 0.5:
+                tree.insert(entry)
+                expected.add(entry)
+            elif entry in expected:
+                tree.delete(entry)
+                expected.remove(entry)
+            if i % 250 == 0:
+                self.assert_avl_invariants(tree, tree.root)
+                self.assertListEqual(list(tree.traverse()), sorted(expected))
+                self.assertEqual(len(tree), len(expected))
+
+        with self.assertRaises(KeyError):
+            tree.delete(1000)
+
+    def test_insert_many(self):
+        tree = NumericAVLTree([5, 1, 3])
+        tree.insert_many([4, 2, 3, 6])
+
+        self.assertListEqual(list(tree.traverse()), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(tree.max(), 6)
+        self.assert_avl_invariants(tree, tree.root)
+        with self.assertRaises(TypeError) as context:
+            tree.insert_many(['a'])
+        self.assertIn("NumericAVLTree.insert_many called with incompatible data type: ",
+                      str(context.exception))
+        self.assertEqual(len(tree), 6)
+
+    def test_insert_many_small_batch_keeps_nodes(self):
+        tree = NumericAVLTree(range(0, 200, 2))
+        ids = {entry: node for node, entry in enumerate(tree._entries) if node}
+        shape = list(tree.traverse('bfs'))[:7]
+        tree.insert_many([51, 101, 51])
+
+        self.assertEqual(len(tree), 102)
+        self.assertListEqual(list(tree.traverse('bfs'))[:7], shape)
+        for entry, node in ids.items():
+            self.assertEqual(tree._entries[node], entry)
+        self.assert_avl_invariants(tree, tree.root)
+
+    def test_insert_many_large_batch(self):
+        tree = NumericAVLTree(range(0, 200, 2))
+        tree.insert_many(range(199, -1, -3))
+
+        expected = sorted(set(range(0, 200, 2)) | set(range(199, -1, -3)))
+        self.assertListEqual(list(tree.traverse()), expected)
+        self.assertEqual(len(tree._entries), len(expected) + 1)
+        self.assertEqual(tree.min(), 0)
+        self.assertEqual(tree.max(), 199)
+        self.assert_avl_invariants(tree, tree.root)
+
+    def test_search_min_max(self):
+        entries = get_random_entries()
+        tree = NumericAVLTree(entries)
+
+        self.assertEqual(tree.search(entries[0]), entries[0])
+        self.assertEqual(tree.max(), max(entries))
+        self.assertEqual(tree.min(), min(entries))
+        with self.assertRaises(KeyError):
+            tree.search(1000000)
+        with self.assertRaises(ValueError):
+            NumericAVLTree().max()
+
+    def test_pred_succ(self):
+        entries = sorted(get_random_entries())
+        tree = NumericAVLTree(entries)
+
+        for prev, entry in zip(entries, entries[1:]):
+            self.assertEqual(tree.pred(entry), prev)
+            self.assertEqual(tree.succ(prev), entry)
+        with self.assertRaises(KeyError):
+            tree.pred(entries[0])
+        with self.assertRaises(KeyError):
+            tree.succ(entries[-1])
+
+    def test_deepcopy(self):
+        import copy
+        tree1 = NumericAVLTree(get_random_entries())
+        tree2 = copy.deepcopy(tree1)
+
+        self.assertEqual(tree1, tree2)
+        tree2.delete(tree2.max())
+        self.assertNotEqual(tree1, tree2)
+
+    def test_clear(self):
+        tree = NumericAVLTree([1, 2, 3])
+        tree.clear()
+
+        self.assertFalse(tree)
+        self.assertEqual(len(tree), 0)
+
+    def assert_avl_invariants(self, tree, node, lower=None, upper=None):
+        if not node:
+            return 0
+        entry = tree._entries[node]
+        if lower is not None:
+            self.assertGreater(entry, lower)
+        if upper is not None:
+            self.assertLess(entry, upper)
+        left_height = self.assert_avl_invariants(tree, tree._left[node], lower, entry)
+        right_height = self.assert_avl_invariants(tree, tree._right[node], entry, upper)
+        self.assertLessEqual(abs(left_height - right_height), 1)
+        self.assertEqual(tree._height[node], 1 + max(left_height, right_height))
+        return tree._height[node]
+
+
+class FrozenAvlTreeTest(unittest.TestCase):
+    def test_empty_tree(self):
+        frozen = AVLTree().freeze()
+
+        self.assertFalse(frozen)
+        self.assertEqual(len(frozen), 0)
+        self.assertEqual(frozen.height, 0)
+        self.assertNotIn(1, frozen)
+        with self.assertRaises(ValueError):
+            frozen.max()
+        with self.assertRaises(ValueError):
+            frozen.min()
+
+    def test_freeze(self):
+        entries = get_random_entries()
+        tree = AVLTree(entries)
+        frozen = tree.freeze()
+
+        self.assertIsInstance(frozen, FrozenAVLTree)
+        self.assertEqual(len(frozen), len(tree))
+        self.assertListEqual(list(frozen.traverse()), sorted(entries))
+        for entry in entries:
+            self.assertIn(entry, frozen)
+            self.assertEqual(frozen.search(entry), entry)
+        self.assertNotIn(min(entries) - 1, frozen)
+        self.assertNotIn(max(entries) + 1, frozen)
+        with self.assertRaises(KeyError):
+            frozen.search(max(entries) + 1)
+
+    def test_freeze_is_a_snapshot(self):
+        tree = AVLTree([1, 2, 3])
+        frozen = tree.freeze()
+        tree.insert(4)
+        tree.delete(1)
+
+        self.assertListEqual(list(frozen.traverse()), [1, 2, 3])
+        self.assertNotIn(4, frozen)
+        self.assertIn(1, frozen)
+
+    def test_traversal(self):
+        frozen = FrozenAVLTree([5, 3, 1, 4, 2])
+
+        self.assertTupleEqual(tuple(frozen.traverse()), (1, 2, 3, 4, 5))
+        self.assertTupleEqual(tuple(frozen.traverse('inorder')), (1, 2, 3, 4, 5))
+        for order in ('preorder', 'postorder', 'bfs'):
+            with self.subTest(f"test {order}"):
+                with self.assertRaises(ValueError):
+                    frozen.traverse(order)
+
+    def test_height(self):
+        for n, height in ((1, 1), (2, 2), (3, 2), (7, 3), (8, 4)):
+            with self.subTest(f"test {n} entries"):
+                frozen = FrozenAVLTree(range(n))
+
+                self.assertEqual(frozen.height, height)
+
+    def test_max_min(self):
+        frozen = FrozenAVLTree([5, 1, 3])
+
+        self.assertEqual(frozen.max(), 5)
+        self.assertEqual(frozen.min(), 1)
+
+    def test_entries_are_only_compared_with_less_than(self):
+        class LessThanOnly(Entry):
+            def __gt__(self, other):
+                raise AssertionError('FrozenAVLTree must only compare entries with <')
+
+        entries = [LessThanOnly(i, 'a') for i in get_random_entries()]
+        frozen = AVLTree(entries).freeze()
+
+        for entry in entries:
+            self.assertEqual(frozen.search(LessThanOnly(entry.a, 'a')), entry)
+        self.assertNotIn(LessThanOnly(-1, 'a'), frozen)
+        self.assertNotIn(LessThanOnly(entries[0].a, 'b'), frozen)
+
+    def test_build_tree_from_other(self):
+        entries = get_random_entries()
+        expected = FrozenAVLTree(entries)
+
+        self.assertEqual(NumericAVLTree(entries).freeze(), FrozenAVLTree(map(float, entries)))
+        self.assertEqual(FrozenAVLTree(BTreeIndex(entries)), expected)
+        self.assertEqual(FrozenAVLTree(iter(entries)), expected)
+
+    def test_str_repr(self):
+        frozen = FrozenAVLTree([3, 1, 2, 2])
+
+        self.assertEqual(repr(frozen), 'FrozenAVLTree([1, 2, 3])')
+        self.assertEqual(str(frozen), 'FrozenAVLTree([1, 2, 3])')
+
+    def test_constructor_not_properly_called(self):
+        with self.assertRaises(TypeError) as context:
+            FrozenAVLTree(1)
+        self.assertIn("FrozenAVLTree constructor called with incompatible data type: ",
+                      str(context.exception))
+
+        with self.assertRaises(TypeError):
+            FrozenAVLTree([1, 'a'])
+
+
 def get_random_entries():
     from random import randint, shuffle, seed
     seed(7477)
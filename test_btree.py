@@ -0,0 +1,211 @@
+"""Copyright (c) 2018 Miguel Mendes, http://miguendes.me/
+
+Permission is hereby granted, free of charge, to any person obtaining
+a copy of this software and associated documentation files (the
+"Software"), to deal in the Software without restriction, including
+without limitation the rights to use, copy, modify, merge, publish,
+distribute, sublicense, and/or sell copies of the Software, and to
+permit persons to whom the Software is furnished to do so, subject to
+the following conditions:
+
+The above copyright notice and this permission notice shall be
+included in all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+import unittest
+
+from avl_tree import AVLTree
+from btree import BTreeIndex
+
+
+class BTreeIndexTest(unittest.TestCase):
+    def test_empty_tree(self):
+        tree = BTreeIndex()
+
+        self.assertFalse(tree)
+        self.assertEqual(len(tree), 0)
+        self.assertEqual(tree.height, 0)
+        self.assertNotIn(10, tree)
+        self.assertTupleEqual(tuple(tree.traverse()), ())
+
+    def test_insert(self):
+        tree = BTreeIndex(order=4)
+        for entry in (9, 4, 14, 17, 7, 9):
+            tree.insert(entry)
+
+        self.assertTrue(tree)
+        self.assertEqual(len(tree), 5)
+        self.assertTupleEqual(tuple(tree.traverse()), (4, 7, 9, 14, 17))
+        self.assertIn(7, tree)
+        self.assertNotIn(8, tree)
+
+    def test_insert_many(self):
+        tree = BTreeIndex([5, 1, 3], order=4)
+        tree.insert_many([4, 2, 3, 6])
+
+        self.assertListEqual(list(tree.traverse()), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(tree), 6)
+
+    def test_height_grows_logarithmically_with_order(self):
+        entries = range(4096)
+
+        self.assertEqual(BTreeIndex(entries, order=4).height, 11)
+        self.assertLessEqual(BTreeIndex(entries, order=64).height, 3)
+
+    def test_invalid_order(self):
+        with self.assertRaises(ValueError):
+            BTreeIndex(order=3)
+        with self.assertRaises(ValueError):
+            BTreeIndex(order=5)
+
+    def test_traversal(self):
+        tree = BTreeIndex([5, 3, 1, 4, 2], order=4)
+
+        self.assertTupleEqual(tuple(tree.traverse()), (1, 2, 3, 4, 5))
+        self.assertTupleEqual(tuple(tree.traverse('inorder')), (1, 2, 3, 4, 5))
+        for order in ('preorder', 'postorder', 'bfs'):
+            with self.subTest(f"test {order}"):
+                with self.assertRaises(ValueError):
+                    tree.traverse(order)
+
+    def test_constructor_not_properly_called(self):
+        with self.assertRaises(TypeError) as context:
+            BTreeIndex(4)
+        self.assertIn("BTreeIndex constructor called with incompatible data type: "
+                      "'int' object is not iterable", str(context.exception))
+
+    def test_build_tree_from_other(self):
+        entries = get_random_entries()
+
+        self.assertEqual(BTreeIndex(AVLTree(entries)), BTreeIndex(entries))
+        self.assertEqual(BTreeIndex(BTreeIndex(entries)), BTreeIndex(entries))
+
+    def test_random_inserts_and_deletes(self):
+        import random
+        random.seed(7477)
+
+        for order in (4, 6, 32):
+            tree = BTreeIndex(order=order)
+            expected = set()
+
+            for i in range(5000):
+                entry = random.randrange(1000)
+                if random.random() < 0.55:
+                    tree.insert(entry)
+                    expected.add(entry)
+                elif entry in expected:
+                    tree.delete(entry)
+                    expected.remove(entry)
+                else:
+                    with self.assertRaises(KeyError):
+                        tree.delete(entry)
+
+                if i % 250 == 0:
+                    with self.subTest(f"test order {order} after {i} operations"):
+                        self.assert_btree_invariants(tree)
+                        self.assertListEqual(list(tree.traverse()), sorted(expected))
+                        self.assertEqual(len(tree), len(expected))
+
+    def test_delete_every_entry(self):
+        entries = get_random_entries()
+        tree = BTreeIndex(entries, order=4)
+
+        for entry in entries:
+            tree.delete(entry)
+            self.assertNotIn(entry, tree)
+
+        self.assertFalse(tree)
+        self.assertEqual(tree.height, 0)
+        with self.assertRaises(KeyError):
+            tree.delete(entries[0])
+
+    def test_search(self):
+        tree = BTreeIndex([1, 2, 3, 4, 5])
+
+        self.assertEqual(tree.search(4), 4)
+        with self.assertRaises(KeyError) as context:
+            tree.search(10)
+        self.assertIn("Entry 10 not found.", str(context.exception))
+
+    def test_min_max(self):
+        entries = get_random_entries()
+        tree = BTreeIndex(entries, order=4)
+
+        self.assertEqual(tree.min(), min(entries))
+        self.assertEqual(tree.max(), max(entries))
+        with self.assertRaises(ValueError):
+            BTreeIndex().max()
+
+    def test_pred_succ(self):
+        entries = sorted(get_random_entries())
+        tree = BTreeIndex(entries, order=4)
+
+        for prev, entry in zip(entries, entries[1:]):
+            self.assertEqual(tree.pred(entry), prev)
+            self.assertEqual(tree.succ(prev), entry)
+        with self.assertRaises(KeyError) as context:
+            tree.pred(entries[0])
+        self.assertIn(f"Predecessor of {entries[0]} not found.", str(context.exception))
+        with self.assertRaises(KeyError) as context:
+            tree.succ(entries[-1])
+        self.assertIn(f"Successor of {entries[-1]} not found.", str(context.exception))
+
+    def test_str_repr(self):
+        tree = BTreeIndex([3, 1, 2], order=8)
+
+        self.assertEqual(repr(tree), 'BTreeIndex([1, 2, 3], order=8)')
+        self.assertEqual(str(tree), 'BTreeIndex([1, 2, 3], order=8)')
+
+    def test_equals(self):
+        tree = BTreeIndex([1, 2, 3, 4, 5], order=4)
+
+        self.assertEqual(tree, BTreeIndex([5, 4, 3, 2, 1], order=32))
+        self.assertNotEqual(tree, BTreeIndex([1, 2, 3, 4]))
+        self.assertNotEqual(tree, AVLTree([1, 2, 3, 4, 5]))
+
+    def test_clear(self):
+        tree = BTreeIndex([1, 2, 3, 4, 5])
+        tree.clear()
+
+        self.assertFalse(tree)
+        self.assertEqual(len(tree), 0)
+
+    def assert_btree_invariants(self, tree):
+        leaf_depths = set()
+        stack = [(tree.root, 1)]
+
+        while stack:
+            node, depth = stack.pop()
+            self.assertListEqual(node.entries, sorted(set(node.entries)))
+            self.assertLess(len(node.entries), tree.order)
+            if node is not tree.root:
+                self.assertGreaterEqual(len(node.entries), tree.order // 2 - 1)
+            if node.children:
+                self.assertEqual(len(node.children), len(node.entries) + 1)
+                stack.extend((child, depth + 1) for child in node.children)
+            else:
+                leaf_depths.add(depth)
+
+        self.assertLessEqual(len(leaf_depths), 1)
+
+
+def get_random_entries():
+    from random import randint, shuffle, seed
+    seed(7477)
+    a = randint(1, 500)
+    b = randint(1, 500)
+    lower, upper = min(a, b), max(a, b)
+    entries = list(range(lower, upper + 1))
+    shuffle(entries)
+    return entries
+
+
+if __name__ == '__main__':
+    unittest.main()